@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import functools
 import itertools
 import logging
 import pandas
@@ -23,14 +24,30 @@ from data_validation import metadata, consts, clients, exceptions
 
 # Check for decimal data type with precision and/or scale. Permits hyphen in p/s for value ranges.
 DECIMAL_PRECISION_SCALE_PATTERN = re.compile(
-    r"([!]?decimal)\(([0-9\-]+)(?:,[ ]*([0-9\-]+))?\)", re.I
+    r"([!]?decimal)\(([0-9\-]+)(?:,[ ]*([0-9\-]+))?\)", re.I | re.ASCII
 )
 # Extract lower/upper from a range of the format "0-2" or "12-18".
 DECIMAL_PRECISION_SCALE_RANGE_PATTERN = re.compile(
-    r"([0-9]{2}|[0-9])(?:\-)([0-9]{2}|[0-9])"
+    r"([0-9]{2}|[0-9])(?:\-)([0-9]{2}|[0-9])", re.ASCII
 )
 
 
+def _allow_list_pair_pattern():
+    """Build the pattern used to split an allow list string into data type pairs."""
+    # Splitting the pattern into variables aids readability.
+    nullable_pattern = r"!?"
+    precision_scale_pattern = r"(?:\((?:[0-9 ,\-]+|'UTC')\))?"
+    data_type_pattern = nullable_pattern + r"[a-z0-9 ]+" + precision_scale_pattern
+    return re.compile(data_type_pattern + r":" + data_type_pattern, re.I | re.ASCII)
+
+
+# Match a single "datatype:datatype" pair within an allow list string.
+ALLOW_LIST_PAIR_PATTERN = _allow_list_pair_pattern()
+
+# Parsed allow lists keyed on the raw allow list string.
+_ALLOW_LIST_CACHE = {}
+
+
 class SchemaValidation(object):
     def __init__(self, config_manager, run_metadata=None, verbose=False):
         """Initialize a SchemaValidation client
@@ -139,6 +156,11 @@ def schema_validation_matching(
 
     # Allow list map in case of incompatible  data types in source and target
     allow_list_map = parse_allow_list(allow_list)
+    allow_list_pairs = frozenset(
+        (allow_source_type, allow_target_type)
+        for allow_source_type, allow_target_types in allow_list_map.items()
+        for allow_target_type in allow_target_types
+    )
     # Go through each source and check if target exists and matches
     for source_field_name, source_field_type in source_fields_casefold.items():
         if source_field_name not in target_fields_casefold:
@@ -167,13 +189,13 @@ def schema_validation_matching(
                     consts.VALIDATION_STATUS_SUCCESS,
                 ]
             )
-        elif (
-            string_val(source_field_type) in allow_list_map
-            and string_val(target_field_type)
-            in allow_list_map[string_val(source_field_type)]
-        ):
+            continue
+
+        source_type_str = string_val(source_field_type)
+        target_type_str = string_val(target_field_type)
+        if (source_type_str, target_type_str) in allow_list_pairs:
             (higher_precision, lower_precision,) = parse_n_validate_datatypes(
-                string_val(source_field_type), string_val(target_field_type)
+                source_type_str, target_type_str
             )
             if lower_precision:
                 results.append(
@@ -189,14 +211,14 @@ def schema_validation_matching(
                 if higher_precision:
                     logging.warning(
                         "Source and target data type has precision mismatch: %s - %s",
-                        string_val(source_field_type),
+                        source_type_str,
                         str(target_field_type),
                     )
                 results.append(
                     [
                         source_field_name,
                         source_field_name,
-                        string_val(source_field_type),
+                        source_type_str,
                         str(target_field_type),
                         consts.VALIDATION_STATUS_SUCCESS,
                     ]
@@ -230,16 +252,9 @@ def schema_validation_matching(
 
 def split_allow_list_str(allow_list_str: str) -> list:
     """Split the allow list string into a list of datatype:datatype tuples."""
-    # I've not moved this patter to a compiled constant because it should only
-    # happen once per command and I felt splitting the pattern into variables
-    # aided readability.
-    nullable_pattern = r"!?"
-    precision_scale_pattern = r"(?:\((?:[0-9 ,\-]+|'UTC')\))?"
-    data_type_pattern = nullable_pattern + r"[a-z0-9 ]+" + precision_scale_pattern
-    csv_split_pattern = data_type_pattern + r":" + data_type_pattern
     data_type_pairs = [
         _.replace(" ", "").split(":")
-        for _ in re.findall(csv_split_pattern, allow_list_str, re.I)
+        for _ in ALLOW_LIST_PAIR_PATTERN.findall(allow_list_str)
     ]
     invalid_pairs = [_ for _ in data_type_pairs if len(_) != 2]
     if invalid_pairs:
@@ -251,21 +266,46 @@ def split_allow_list_str(allow_list_str: str) -> list:
 
 def expand_precision_range(s: str) -> list:
     """Expand an integer range (e.g. "0-3") to a list (e.g. ["0", "1", "2", "3"])."""
-    m_range = DECIMAL_PRECISION_SCALE_RANGE_PATTERN.match(s)
-    if not m_range:
-        return [s]
-    try:
-        p_lower = int(m_range.group(1))
-        p_upper = int(m_range.group(2))
-        if p_lower >= p_upper:
-            raise exceptions.SchemaValidationException(
-                f"Invalid allow list data type precision/scale: Lower value {p_lower} >= upper value {p_upper}"
-            )
-        return [str(_) for _ in range(p_lower, p_upper + 1)]
-    except ValueError as e:
+    return list(_expand_precision_range(s))
+
+
+def _is_ascii_digits(s: str) -> bool:
+    return bool(s) and all(c in "0123456789" for c in s)
+
+
+def _split_range(s: str):
+    """Scan the lower/upper bounds from a range like "0-2" or "12-18)".
+
+    Equivalent to DECIMAL_PRECISION_SCALE_RANGE_PATTERN.match() without the regex
+    engine. Returns None when s does not start with a range."""
+    lower, dash, rest = s.partition("-")
+    if not dash or len(lower) > 2 or not _is_ascii_digits(lower):
+        return None
+    if _is_ascii_digits(rest[:2]):
+        upper = rest[:2]
+    elif _is_ascii_digits(rest[:1]):
+        upper = rest[:1]
+    else:
+        return None
+    return int(lower), int(upper)
+
+
+@functools.lru_cache(maxsize=1024)
+def _expand_precision_range(s: str) -> tuple:
+    p_range = _split_range(s)
+    if not p_range:
+        return (s,)
+    p_lower, p_upper = p_range
+    if p_lower >= p_upper:
         raise exceptions.SchemaValidationException(
-            f"Invalid allow list data type precision/scale: {s}"
-        ) from e
+            f"Invalid allow list data type precision/scale: Lower value {p_lower} >= upper value {p_upper}"
+        )
+    return _range_strs(p_lower, p_upper)
+
+
+@functools.lru_cache(maxsize=256)
+def _range_strs(lower: int, upper: int) -> tuple:
+    return tuple(map(str, range(lower, upper + 1)))
 
 
 def expand_precision_or_scale_range(data_type: str) -> list:
@@ -273,26 +313,44 @@ def expand_precision_or_scale_range(data_type: str) -> list:
 
     For example "decimal(1-3,0)" becomes:
       ["decimal(1,0)", "decimal(2,0)", "decimal(3,0)"]"""
+    return list(_expand_precision_or_scale_range(data_type))
 
-    m = DECIMAL_PRECISION_SCALE_PATTERN.match(data_type.replace(" ", ""))
-    if not m:
-        return [data_type]
 
-    if len(m.groups()) != 3:
-        raise exceptions.SchemaValidationException(
-            f"Badly formatted data type: {data_type}"
-        )
+def _parse_decimal(data_type: str):
+    """Scan a decimal data type into its (type_name, precision, scale) parts.
+
+    Equivalent to DECIMAL_PRECISION_SCALE_PATTERN.match() without the regex engine,
+    scale is None if not specified. Returns None for any other data type."""
+    paren = data_type.find("(")
+    if paren == -1 or data_type[:paren].lower() not in ("decimal", "!decimal"):
+        return None
+    close = data_type.find(")", paren)
+    if close == -1:
+        return None
+    p, comma, s = data_type[paren + 1 : close].partition(",")
+    if not _is_precision_or_scale(p) or (comma and not _is_precision_or_scale(s)):
+        return None
+    return data_type[:paren], p, s or None
+
+
+def _is_precision_or_scale(s: str) -> bool:
+    return bool(s) and all(c in "0123456789-" for c in s)
 
-    type_name, p, s = m.groups()
-    p_list = expand_precision_range(p)
+
+@functools.lru_cache(maxsize=1024)
+def _expand_precision_or_scale_range(data_type: str) -> tuple:
+    parsed = _parse_decimal(data_type.replace(" ", ""))
+    if not parsed:
+        return (data_type,)
+
+    type_name, p, s = parsed
+    p_list = _expand_precision_range(p)
     if s:
-        s_list = expand_precision_range(s)
-        return_list = [
+        s_list = _expand_precision_range(s)
+        return tuple(
             f"{type_name}({p},{s})" for p, s in itertools.product(p_list, s_list)
-        ]
-    else:
-        return_list = [f"{type_name}({_})" for _ in p_list]
-    return return_list
+        )
+    return tuple(f"{type_name}({_})" for _ in p_list)
 
 
 def parse_allow_list(st: str) -> dict:
@@ -301,8 +359,8 @@ def parse_allow_list(st: str) -> dict:
     def expand_allow_list_ranges(data_type_pairs: list) -> list:
         expanded_pairs = []
         for dt1, dt2 in data_type_pairs:
-            dt1_list = expand_precision_or_scale_range(dt1)
-            dt2_list = expand_precision_or_scale_range(dt2)
+            dt1_list = _expand_precision_or_scale_range(dt1)
+            dt2_list = _expand_precision_or_scale_range(dt2)
             expanded_pairs.extend(
                 [(_[0], _[1]) for _ in itertools.product(dt1_list, dt2_list)]
             )
@@ -323,10 +381,12 @@ def parse_allow_list(st: str) -> dict:
                 return_pairs[dt1] = [dt2]
         return return_pairs
 
-    data_type_pairs = split_allow_list_str(st)
-    expanded_pairs = expand_allow_list_ranges(data_type_pairs)
-    return_pairs = convert_pairs_to_dict(expanded_pairs)
-    return return_pairs
+    if st not in _ALLOW_LIST_CACHE:
+        data_type_pairs = split_allow_list_str(st)
+        expanded_pairs = expand_allow_list_ranges(data_type_pairs)
+        _ALLOW_LIST_CACHE[st] = convert_pairs_to_dict(expanded_pairs)
+    # Copy the cached value so callers cannot mutate it.
+    return {k: list(v) for k, v in _ALLOW_LIST_CACHE[st].items()}
 
 
 # typea data types: int8,int16
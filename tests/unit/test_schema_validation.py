@@ -12,19 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import collections
+import itertools
+import numpy as np
+import orjson
 import pytest
 import random
-from datetime import datetime, timedelta
-
-from data_validation import consts, data_validation
-from data_validation.schema_validation import (
-    expand_precision_range,
-    expand_precision_or_scale_range,
-    parse_allow_list,
-    DECIMAL_PRECISION_SCALE_RANGE_PATTERN,
-)
+import types
+from datetime import datetime
+
 
+# Keep the regex-only tests on one xdist worker under --dist=loadgroup.
+pytestmark = [pytest.mark.xdist_group("schema_regex")]
 
 SOURCE_TABLE_FILE_PATH = "source_table_data.json"
 TARGET_TABLE_FILE_PATH = "target_table_data.json"
@@ -43,28 +42,6 @@ TARGET_CONN_CONFIG = {
     "file_type": "json",
 }
 
-SAMPLE_SCHEMA_CONFIG = {
-    # BigQuery Specific Connection Config
-    "source_conn": SOURCE_CONN_CONFIG,
-    "target_conn": TARGET_CONN_CONFIG,
-    # Validation Type
-    consts.CONFIG_TYPE: "Schema",
-    # Configuration Required Depending on Validator Type
-    "schema_name": None,
-    "table_name": "my_table",
-    "target_schema_name": None,
-    "target_table_name": "my_table",
-    consts.CONFIG_GROUPED_COLUMNS: [],
-    consts.CONFIG_AGGREGATES: [],
-    consts.CONFIG_THRESHOLD: 0.0,
-    consts.CONFIG_RESULT_HANDLER: None,
-    consts.CONFIG_LABELS: [
-        ("label_1_name", "label_1_value"),
-        ("label_2_name", "label_2_value"),
-    ],
-    consts.CONFIG_FORMAT: "table",
-}
-
 STRING_CONSTANT = "constant"
 
 SOURCE_QUERY_DATA = [
@@ -80,25 +57,92 @@ SOURCE_QUERY_DATA = [
 
 RANDOM_STRINGS = ["a", "b", "c", "d"]
 
+FAKE_ROW_FIELDS = (
+    "id",
+    "date_value",
+    "timestamp_value",
+    "int_value",
+    "text_constant",
+    "text_value",
+    "text_value_two",
+)
 
-@pytest.fixture
+# Expected parse_allow_list results for the larger range expansions.
+_EXPECTED_1_9_0 = {f"decimal({p},0)": ["int32"] for p in range(1, 10)}
+_DECIMAL_10_11_2_4 = [
+    "decimal(10,2)",
+    "decimal(10,3)",
+    "decimal(10,4)",
+    "decimal(11,2)",
+    "decimal(11,3)",
+    "decimal(11,4)",
+]
+_EXPECTED_9_10_1_2 = {
+    "decimal(9,1)": _DECIMAL_10_11_2_4,
+    "decimal(9,2)": _DECIMAL_10_11_2_4,
+    "decimal(10,1)": _DECIMAL_10_11_2_4,
+    "decimal(10,2)": _DECIMAL_10_11_2_4,
+}
+
+
+@pytest.fixture(scope="session")
 def ibis_pandas():
     import ibis
 
     return ibis.pandas.connect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def module_under_test():
     import data_validation.schema_validation
 
     return data_validation.schema_validation
 
 
+@pytest.fixture(scope="module")
+def consts():
+    import data_validation.consts
+
+    return data_validation.consts
+
+
+@pytest.fixture(scope="module")
+def sample_schema_config(consts):
+    """Read-only schema config shared by the tests in this module."""
+    return types.MappingProxyType(
+        {
+            # BigQuery Specific Connection Config
+            "source_conn": SOURCE_CONN_CONFIG,
+            "target_conn": TARGET_CONN_CONFIG,
+            # Validation Type
+            consts.CONFIG_TYPE: "Schema",
+            # Configuration Required Depending on Validator Type
+            "schema_name": None,
+            "table_name": "my_table",
+            "target_schema_name": None,
+            "target_table_name": "my_table",
+            consts.CONFIG_GROUPED_COLUMNS: [],
+            consts.CONFIG_AGGREGATES: [],
+            consts.CONFIG_THRESHOLD: 0.0,
+            consts.CONFIG_RESULT_HANDLER: None,
+            consts.CONFIG_LABELS: [
+                ("label_1_name", "label_1_value"),
+                ("label_2_name", "label_2_value"),
+            ],
+            consts.CONFIG_FORMAT: "table",
+        }
+    )
+
+
 def _create_table_file(table_path, data):
-    """Create JSON File"""
-    with open(table_path, "w") as f:
-        f.write(data)
+    """Create JSON File, serializing one row at a time."""
+    with open(table_path, "wb") as f:
+        f.write(b"[")
+        for i, row in enumerate(data):
+            if i:
+                f.write(b",\n")
+            f.write(orjson.dumps(row._asdict(), option=orjson.OPT_NAIVE_UTC))
+        f.write(b"]")
 
 
 def _generate_fake_data(
@@ -109,9 +153,9 @@ def _generate_fake_data(
     random_strings=None,
     rename_columns=None,
 ):
-    """Return a list of dicts with given number of rows.
+    """Return a list of namedtuples with given number of rows.
 
-    Data Keys:
+    Data Fields:
         id: a unique int per row
         timestamp_value: a random timestamp in the past {second_range} back
         date_value: a random date in the past {second_range} back
@@ -119,37 +163,56 @@ def _generate_fake_data(
         text_value: a random string from supplied list
     """
     rename_columns = rename_columns or {}
-    data = []
     random_strings = random_strings or RANDOM_STRINGS
-    for i in range(initial_id, initial_id + rows):
-        rand_seconds = random.randint(0, second_range)
-        rand_timestamp = datetime.now() - timedelta(seconds=rand_seconds)
-        rand_date = rand_timestamp.date()
-
-        row = {
-            "id": i,
-            "date_value": rand_date,
-            "timestamp_value": rand_timestamp,
-            "int_value": random.randint(0, int_range),
-            "text_constant": STRING_CONSTANT,
-            "text_value": random.choice(random_strings),
-            "text_value_two": random.choice(random_strings),
-        }
-        for key in rename_columns:
-            if key in row:
-                row[rename_columns[key]] = row.pop(key)
-
-        data.append(row)
+    rng = np.random.default_rng()
+
+    ids = np.arange(initial_id, initial_id + rows)
+    secs = rng.integers(0, second_range, size=rows, endpoint=True)
+    ints = rng.integers(0, int_range, size=rows, endpoint=True)
+    text_values = random.choices(random_strings, k=rows)
+    text_values_two = random.choices(random_strings, k=rows)
+    base = np.datetime64(datetime.now(), "us")
+    timestamps = base - secs.astype("timedelta64[s]")
+    dates = timestamps.astype("datetime64[D]")
+
+    row_type = collections.namedtuple(
+        "FakeRow", [rename_columns.get(field, field) for field in FAKE_ROW_FIELDS]
+    )
+    return [
+        row_type._make(values)
+        for values in zip(
+            ids.tolist(),
+            dates.tolist(),
+            timestamps.tolist(),
+            ints.tolist(),
+            itertools.repeat(STRING_CONSTANT),
+            text_values,
+            text_values_two,
+        )
+    ]
 
-    return data
 
+@pytest.fixture(scope="module")
+def fake_table_data():
+    """Source/target rows, generated once per module."""
+    num_rows = 1
+    source_data = _generate_fake_data(rows=num_rows, second_range=0)
+    # Create target data with new field
+    target_data = _generate_fake_data(
+        rows=num_rows, second_range=0, rename_columns={"id": "id_new"}
+    )
+    return {
+        SOURCE_TABLE_FILE_PATH: source_data,
+        TARGET_TABLE_FILE_PATH: target_data,
+    }
 
-def _get_fake_json_data(data):
-    for row in data:
-        row["date_value"] = str(row["date_value"])
-        row["timestamp_value"] = str(row["timestamp_value"])
 
-    return json.dumps(data)
+@pytest.fixture
+def fake_tables(fs, fake_table_data):
+    """Write the shared rows to the fake file system."""
+    for table_path, data in fake_table_data.items():
+        _create_table_file(table_path, data)
+    return SOURCE_TABLE_FILE_PATH, TARGET_TABLE_FILE_PATH
 
 
 def test_import(module_under_test):
@@ -163,9 +226,16 @@ def test_import(module_under_test):
         ("6-11", ("6", "11")),
         ("10-18", ("10", "18")),
     ],
+    ids=[
+        "0-3",
+        "6-11",
+        "10-18",
+    ],
 )
-def test_DECIMAL_PRECISION_SCALE_RANGE_PATTERN(test_input: str, expected: tuple):
-    m = DECIMAL_PRECISION_SCALE_RANGE_PATTERN.match(test_input)
+def test_DECIMAL_PRECISION_SCALE_RANGE_PATTERN(
+    module_under_test, test_input: str, expected: tuple
+):
+    m = module_under_test.DECIMAL_PRECISION_SCALE_RANGE_PATTERN.match(test_input)
     assert m
     assert m.groups() == expected
 
@@ -182,9 +252,19 @@ def test_DECIMAL_PRECISION_SCALE_RANGE_PATTERN(test_input: str, expected: tuple)
         ("10-13)", ["10", "11", "12", "13"]),
         ("19-21)", ["19", "20", "21"]),
     ],
+    ids=[
+        "empty",
+        "0",
+        "3",
+        "utc",
+        "0-1",
+        "7-11",
+        "10-13",
+        "19-21",
+    ],
 )
-def test_expand_precision_range(test_input: str, expected: list):
-    assert expand_precision_range(test_input) == expected
+def test_expand_precision_range(module_under_test, test_input: str, expected: list):
+    assert module_under_test.expand_precision_range(test_input) == expected
 
 
 @pytest.mark.parametrize(
@@ -205,9 +285,24 @@ def test_expand_precision_range(test_input: str, expected: list):
             ["decimal(4,1)", "decimal(4,2)", "decimal(5,1)", "decimal(5,2)"],
         ),
     ],
+    ids=[
+        "empty",
+        "int32",
+        "not_null_int32",
+        "decimal_p",
+        "decimal_p_s",
+        "decimal_p_s_space",
+        "decimal_p_range",
+        "not_null_decimal_p_range",
+        "decimal_p_range_two_digit",
+        "decimal_s_range",
+        "decimal_p_s_range",
+    ],
 )
-def test_expand_precision_or_scale_range(test_input: str, expected: list):
-    assert expand_precision_or_scale_range(test_input) == expected
+def test_expand_precision_or_scale_range(
+    module_under_test, test_input: str, expected: list
+):
+    assert module_under_test.expand_precision_or_scale_range(test_input) == expected
 
 
 @pytest.mark.parametrize(
@@ -241,17 +336,7 @@ def test_expand_precision_or_scale_range(test_input: str, expected: list):
         ("!int64:int32", {"!int64": ["int32"]}),
         (
             "decimal(1-9,0):int32",
-            {
-                "decimal(1,0)": ["int32"],
-                "decimal(2,0)": ["int32"],
-                "decimal(3,0)": ["int32"],
-                "decimal(4,0)": ["int32"],
-                "decimal(5,0)": ["int32"],
-                "decimal(6,0)": ["int32"],
-                "decimal(7,0)": ["int32"],
-                "decimal(8,0)": ["int32"],
-                "decimal(9,0)": ["int32"],
-            },
+            _EXPECTED_1_9_0,
         ),
         (
             "decimal(10,0-2):decimal(10,2)",
@@ -263,49 +348,37 @@ def test_expand_precision_or_scale_range(test_input: str, expected: list):
         ),
         (
             "decimal(9-10,1-2):decimal(10-11,2-4)",
-            {
-                "decimal(9,1)": [
-                    "decimal(10,2)",
-                    "decimal(10,3)",
-                    "decimal(10,4)",
-                    "decimal(11,2)",
-                    "decimal(11,3)",
-                    "decimal(11,4)",
-                ],
-                "decimal(9,2)": [
-                    "decimal(10,2)",
-                    "decimal(10,3)",
-                    "decimal(10,4)",
-                    "decimal(11,2)",
-                    "decimal(11,3)",
-                    "decimal(11,4)",
-                ],
-                "decimal(10,1)": [
-                    "decimal(10,2)",
-                    "decimal(10,3)",
-                    "decimal(10,4)",
-                    "decimal(11,2)",
-                    "decimal(11,3)",
-                    "decimal(11,4)",
-                ],
-                "decimal(10,2)": [
-                    "decimal(10,2)",
-                    "decimal(10,3)",
-                    "decimal(10,4)",
-                    "decimal(11,2)",
-                    "decimal(11,3)",
-                    "decimal(11,4)",
-                ],
-            },
+            _EXPECTED_9_10_1_2,
         ),
     ],
+    ids=[
+        "empty",
+        "int32_int64",
+        "mixed_case",
+        "string_string",
+        "multiple_pairs",
+        "date_timestamp",
+        "timestamp_utc",
+        "decimal_spaces",
+        "not_null_target",
+        "not_null_source",
+        "decimal_p_range",
+        "decimal_s_range",
+        "decimal_p_s_ranges",
+    ],
 )
-def test_parse_allow_list(test_input: str, expected: dict):
-    assert parse_allow_list(test_input) == expected
+def test_parse_allow_list(module_under_test, test_input: str, expected: dict):
+    assert module_under_test.parse_allow_list(test_input) == expected
+
+
+def test_parse_allow_list_cached_result_is_copied(module_under_test):
+    allow_list = module_under_test.parse_allow_list("int32:int64")
+    allow_list["int32"].append("string")
+    assert module_under_test.parse_allow_list("int32:int64") == {"int32": ["int64"]}
 
 
 # Basic unit test  for schema validation.
-def test_schema_validation_matching(module_under_test):
+def test_schema_validation_matching(module_under_test, consts):
     source_fields = {"FIELD1": "string", "fiEld2": "datetime", "field3": "string"}
     target_fields = {"field1": "string", "field2": "timestamp", "field_3": "string"}
 
@@ -345,7 +418,7 @@ def test_schema_validation_matching(module_under_test):
 
 
 # Unit test adding validation for exclusion columns in schema validation.
-def test_schema_validation_matching_exclusion_columns(module_under_test):
+def test_schema_validation_matching_exclusion_columns(module_under_test, consts):
     source_fields = {"FIELD1": "string", "fiEld2": "datetime", "field3": "string"}
     target_fields = {"field1": "string", "field2": "timestamp", "field_3": "string"}
 
@@ -379,7 +452,7 @@ def test_schema_validation_matching_exclusion_columns(module_under_test):
 
 
 # Testing for allow list functionality, covers allowing multiple vallues for a same datatype.
-def test_schema_validation_matching_allowlist_columns(module_under_test):
+def test_schema_validation_matching_allowlist_columns(module_under_test, consts):
     source_fields = {
         "FIELD1": "string",
         "fiEld2": "datetime",
@@ -450,23 +523,26 @@ def test_schema_validation_matching_allowlist_columns(module_under_test):
     )
 
 
-def test_execute(module_under_test, ibis_pandas, fs):
-    num_rows = 1
-    source_data = _generate_fake_data(rows=num_rows, second_range=0)
-    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(source_data))
+@pytest.mark.xdist_group("schema_ibis")
+def test_execute(
+    module_under_test,
+    ibis_pandas,
+    consts,
+    sample_schema_config,
+    fake_table_data,
+    fake_tables,
+):
+    from data_validation import data_validation
 
-    # Create target data with new field
-    target_data = _generate_fake_data(
-        rows=num_rows, second_range=0, rename_columns={"id": "id_new"}
-    )
-    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(target_data))
+    source_table_path, _ = fake_tables
+    source_data = fake_table_data[source_table_path]
 
-    dv_client = data_validation.DataValidation(SAMPLE_SCHEMA_CONFIG, verbose=True)
+    dv_client = data_validation.DataValidation(sample_schema_config, verbose=True)
     result_df = dv_client.schema_validator.execute()
     failures = result_df[
         result_df["validation_status"].str.contains(consts.VALIDATION_STATUS_FAIL)
     ]
     assert len(result_df) == len(source_data[0]) + 1
-    assert result_df.labels[0] == SAMPLE_SCHEMA_CONFIG[consts.CONFIG_LABELS]
+    assert result_df.labels[0] == sample_schema_config[consts.CONFIG_LABELS]
     assert failures["source_column_name"].to_list() == ["id", "N/A"]
     assert failures["target_column_name"].to_list() == ["N/A", "id_new"]